@@ -0,0 +1,293 @@
+"""Async database module for MongoDB CRUD operations from asyncio applications."""
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import PyMongoError
+
+from time_management_system.database import (
+    CODEC_OPTIONS,
+    Projection,
+    as_update,
+    load_mongo_settings,
+    to_object_id,
+)
+from time_management_system.logger import get_logger
+
+logger = get_logger(Path(__file__).stem)
+
+
+class _LoopConnection:
+    """An AsyncMongoClient and the database and collection handles built from it, for one event loop."""
+
+    __slots__ = ("client", "database", "collections")
+
+    def __init__(self, client: AsyncMongoClient, database: AsyncDatabase):
+        """Wrap ``client`` and its ``database`` handle with an empty collection cache."""
+        self.client = client
+        self.database = database
+        self.collections: dict[str, AsyncCollection] = {}
+
+
+class AsyncDBClient:
+    """Async counterpart of DBClient for request-per-coroutine servers.
+
+    AsyncMongoClient instances are bound to the event loop they were created on, so one client (and its
+    connection pool) is kept per running loop and shared by every coroutine on that loop.
+    """
+
+    def __init__(self):
+        """Initialize the AsyncDBClient from environment variables; clients are created on first use."""
+        self._settings = settings = load_mongo_settings()
+        self.host = settings.host
+        self.port = settings.port
+        self.database_name = settings.database_name
+        # AsyncMongoClient references its loop, so a weak mapping would never drop entries; closed loops are
+        # pruned instead whenever a new loop connects
+        self._connections: dict[asyncio.AbstractEventLoop, _LoopConnection] = {}
+        self._lock = threading.Lock()
+
+    def _get_connection(self) -> _LoopConnection:
+        """Return the connection for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        connection = self._connections.get(loop)
+        if connection is None:
+            with self._lock:
+                connection = self._connections.get(loop)
+                if connection is None:
+                    self._prune_closed_loops()
+                    client = AsyncMongoClient(self._settings.connection_string, **self._settings.client_options)
+                    database = client.get_database(self.database_name, codec_options=CODEC_OPTIONS)
+                    connection = self._connections[loop] = _LoopConnection(client, database)
+        return connection
+
+    def _prune_closed_loops(self):
+        """Forget connections whose event loop has been closed.
+
+        Their clients can no longer be awaited, and the loop's sockets were torn down when it closed, so the
+        entries are only dropped to release the loop and client objects.
+        """
+        for loop in [loop for loop in self._connections if loop.is_closed()]:
+            del self._connections[loop]
+
+    def get_database(self) -> AsyncDatabase:
+        """Get the database for the running event loop."""
+        return self._get_connection().database
+
+    def get_collection(self, collection_name: str) -> AsyncCollection:
+        """Get a collection for the running event loop; handles are cached per loop and name."""
+        connection = self._get_connection()
+        collection = connection.collections.get(collection_name)
+        if collection is None:
+            collection = connection.collections[collection_name] = connection.database[collection_name]
+        return collection
+
+    async def close_connection(self):
+        """Close the MongoDB client bound to the running event loop."""
+        connection = self._connections.pop(asyncio.get_running_loop(), None)
+        if connection is not None:
+            await connection.client.close()
+            logger.info("MongoDB connection closed")
+
+    # CREATE operations
+    async def insert_one(self, collection_name: str, document: dict[str, Any]) -> str:
+        """Insert a single document into the collection."""
+        try:
+            result = await self.get_collection(collection_name).insert_one(document)
+            return str(result.inserted_id)
+        except PyMongoError as exc:
+            logger.error("Error inserting document: %s", exc)
+            raise
+
+    async def insert_many(
+        self, collection_name: str, documents: list[dict[str, Any]], ordered: bool = False
+    ) -> list[str]:
+        """Insert multiple documents into the collection, unordered by default."""
+        try:
+            result = await self.get_collection(collection_name).insert_many(documents, ordered=ordered)
+            return list(map(str, result.inserted_ids))
+        except PyMongoError as exc:
+            logger.error("Error inserting documents: %s", exc)
+            raise
+
+    # READ operations
+    async def find_one(
+        self,
+        collection_name: str,
+        filter_dict: Optional[dict[str, Any]] = None,
+        projection: Optional[Projection] = None,
+    ) -> Optional[dict[str, Any]]:
+        """Find a single document in the collection."""
+        try:
+            result = await self.get_collection(collection_name).find_one(filter_dict or {}, projection)
+            if result and "_id" in result:
+                result["_id"] = str(result["_id"])
+            return result
+        except PyMongoError as exc:
+            logger.error("Error finding document: %s", exc)
+            raise
+
+    async def find_by_id(
+        self, collection_name: str, document_id: Union[str, ObjectId], projection: Optional[Projection] = None
+    ) -> Optional[dict[str, Any]]:
+        """Find a document by its ObjectId."""
+        try:
+            return await self.find_one(collection_name, {"_id": to_object_id(document_id)}, projection)
+        except InvalidId as exc:
+            logger.error("Invalid ObjectId format: %s", exc)
+            raise
+
+    async def find_many(
+        self,
+        collection_name: str,
+        filter_dict: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        skip: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        projection: Optional[Projection] = None,
+    ) -> list[dict[str, Any]]:
+        """Find multiple documents in the collection."""
+        try:
+            cursor = self.get_collection(collection_name).find(filter_dict or {}, projection)
+
+            if skip:
+                cursor = cursor.skip(skip)
+            if limit:
+                cursor = cursor.limit(limit)
+            if batch_size:
+                cursor = cursor.batch_size(batch_size)
+
+            results = await cursor.to_list()
+            for doc in results:
+                if "_id" in doc:
+                    doc["_id"] = str(doc["_id"])
+            return results
+        except PyMongoError as exc:
+            logger.error("Error finding documents: %s", exc)
+            raise
+
+    async def count_documents(self, collection_name: str, filter_dict: Optional[dict[str, Any]] = None) -> int:
+        """Count documents in the collection, reading collection metadata when there is no filter."""
+        try:
+            collection = self.get_collection(collection_name)
+            if not filter_dict:
+                return await collection.estimated_document_count()
+            return await collection.count_documents(filter_dict)
+        except PyMongoError as exc:
+            logger.error("Error counting documents: %s", exc)
+            raise
+
+    # UPDATE operations
+    async def update_one(
+        self,
+        collection_name: str,
+        filter_dict: dict[str, Any],
+        update_dict: dict[str, Any],
+        upsert: bool = False,
+        is_update_op: Optional[bool] = None,
+    ) -> bool:
+        """Update a single document in the collection, wrapping plain field values in ``$set``."""
+        try:
+            result = await self.get_collection(collection_name).update_one(
+                filter_dict, as_update(update_dict, is_update_op), upsert=upsert
+            )
+            return result.modified_count > 0 or result.upserted_id is not None
+        except PyMongoError as exc:
+            logger.error("Error updating document: %s", exc)
+            raise
+
+    async def update_by_id(
+        self,
+        collection_name: str,
+        document_id: Union[str, ObjectId],
+        update_dict: dict[str, Any],
+        is_update_op: Optional[bool] = None,
+    ) -> bool:
+        """Update a document by its ObjectId."""
+        try:
+            return await self.update_one(
+                collection_name, {"_id": to_object_id(document_id)}, update_dict, is_update_op=is_update_op
+            )
+        except InvalidId as exc:
+            logger.error("Invalid ObjectId format: %s", exc)
+            raise
+
+    async def update_many(
+        self,
+        collection_name: str,
+        filter_dict: dict[str, Any],
+        update_dict: dict[str, Any],
+        is_update_op: Optional[bool] = None,
+    ) -> int:
+        """Update multiple documents in the collection, wrapping plain field values in ``$set``."""
+        try:
+            result = await self.get_collection(collection_name).update_many(
+                filter_dict, as_update(update_dict, is_update_op)
+            )
+            return result.modified_count
+        except PyMongoError as exc:
+            logger.error("Error updating documents: %s", exc)
+            raise
+
+    # DELETE operations
+    async def delete_one(self, collection_name: str, filter_dict: dict[str, Any]) -> bool:
+        """Delete a single document from the collection."""
+        try:
+            result = await self.get_collection(collection_name).delete_one(filter_dict)
+            return result.deleted_count > 0
+        except PyMongoError as exc:
+            logger.error("Error deleting document: %s", exc)
+            raise
+
+    async def delete_by_id(self, collection_name: str, document_id: Union[str, ObjectId]) -> bool:
+        """Delete a document by its ObjectId."""
+        try:
+            return await self.delete_one(collection_name, {"_id": to_object_id(document_id)})
+        except InvalidId as exc:
+            logger.error("Invalid ObjectId format: %s", exc)
+            raise
+
+    async def delete_many(self, collection_name: str, filter_dict: dict[str, Any]) -> int:
+        """Delete multiple documents from the collection."""
+        try:
+            result = await self.get_collection(collection_name).delete_many(filter_dict)
+            return result.deleted_count
+        except PyMongoError as exc:
+            logger.error("Error deleting documents: %s", exc)
+            raise
+
+
+_async_db_client: Optional[AsyncDBClient] = None
+_async_db_client_lock = threading.Lock()
+
+
+def get_async_db_client() -> AsyncDBClient:
+    """Return the process-wide AsyncDBClient, creating it on first call.
+
+    Every caller shares one client per event loop, and its connection pool. A failed construction is not stored,
+    so the next call retries.
+    """
+    global _async_db_client
+    db_client = _async_db_client
+    if db_client is None:
+        with _async_db_client_lock:
+            db_client = _async_db_client
+            if db_client is None:
+                db_client = _async_db_client = AsyncDBClient()
+    return db_client
+
+
+async def reset_async_db_client():
+    """Close the process-wide AsyncDBClient's client for the running loop so the next call builds a fresh one."""
+    global _async_db_client
+    with _async_db_client_lock:
+        db_client, _async_db_client = _async_db_client, None
+    if db_client is not None:
+        await db_client.close_connection()
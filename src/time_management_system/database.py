@@ -1,133 +1,399 @@
 """Database module for MongoDB CRUD operations and connection management."""
 
+import copy
 import os
+import re
 import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Mapping, NamedTuple, Optional, Union
 from urllib.parse import quote_plus
 
 from bson import ObjectId
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
 from bson.errors import InvalidId
+from bson.raw_bson import RawBSONDocument
 from dotenv import load_dotenv
-from pymongo import MongoClient
+from pymongo import (
+    ASCENDING,
+    DeleteMany,
+    DeleteOne,
+    IndexModel,
+    InsertOne,
+    MongoClient,
+    ReplaceOne,
+    UpdateMany,
+    UpdateOne,
+)
 from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.errors import ConnectionFailure, PyMongoError
+from pymongo.results import BulkWriteResult
+from pymongo.write_concern import WriteConcern
 
 from time_management_system.logger import get_logger
 
 logger = get_logger(Path(__file__).stem)
 
+# Load environment variables from .env file once per process; set DBCLIENT_SKIP_DOTENV to rely on the environment
+if not os.getenv("DBCLIENT_SKIP_DOTENV"):
+    load_dotenv()
 
-class DBClient:
-    """Singleton class for MongoDB CRUD operations.
+WriteOperation = Union[InsertOne, UpdateOne, UpdateMany, ReplaceOne, DeleteOne, DeleteMany]
+
+Projection = Union[dict[str, Any], list[str]]
+
+# (collection name, lower-case document ID, repr of the projection or None)
+CacheKey = tuple[str, str, Optional[str]]
+
+CODEC_OPTIONS: CodecOptions[dict[str, Any]] = CodecOptions(
+    tz_aware=False, uuid_representation=UuidRepresentation.STANDARD
+)
+RAW_CODEC_OPTIONS: CodecOptions[RawBSONDocument] = CODEC_OPTIONS.with_options(document_class=RawBSONDocument)
+
+REQUIRED_ENV_VARS = (
+    "MONGO_HOST",
+    "MONGO_PORT",
+    "MONGO_INITDB_ROOT_USERNAME",
+    "MONGO_INITDB_ROOT_PASSWORD",
+    "MONGO_INITDB_DATABASE",
+)
+
+DEFAULT_POOL_OPTIONS = {"maxPoolSize": 50, "minPoolSize": 5, "waitQueueTimeoutMS": 2000}
+
+# Provided by the pymongo[zstd,snappy] extras. zlib spends noticeably more CPU per message, so it is left to
+# MONGO_COMPRESSORS for bandwidth-bound links.
+DEFAULT_COMPRESSORS = "zstd,snappy"
 
-    Provides thread-safe access to MongoDB with common CRUD operations.
+_is_valid_oid = re.compile(r"[0-9a-fA-F]{24}").fullmatch
+
+
+def to_object_id(document_id: Union[str, ObjectId]) -> ObjectId:
+    """Convert a 24-character hex string to an ObjectId, raising InvalidId without touching bson otherwise.
+
+    ObjectId instances, e.g. ``_id`` values read with ``stringify_ids=False``, are returned unchanged.
     """
+    if isinstance(document_id, ObjectId):
+        return document_id
+    if not isinstance(document_id, str) or not _is_valid_oid(document_id):
+        raise InvalidId(f"{document_id!r} is not a valid ObjectId, it must be a 24-character hex string")
+    return ObjectId(bytes.fromhex(document_id))
 
-    _instance = None
-    _lock = threading.Lock()
 
-    def __new__(cls):
-        """Create or return the singleton instance of DBClient.
+def _set(fields: dict[str, Any]) -> dict[str, Any]:
+    """Wrap plain field values in a ``$set`` update operator."""
+    return {"$set": fields}
 
-        Uses double-checked locking for thread safety.
-        """
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:  # Double-check locking for multi-threading safety
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self):
-        """Initialize the DBClient, load environment variables, and connect to MongoDB."""
-        if self._initialized:
-            return
 
-        # Load environment variables from .env file
-        load_dotenv()
+def as_update(update_dict: dict[str, Any], is_update_op: Optional[bool] = None) -> dict[str, Any]:
+    """Return ``update_dict`` as an update document, wrapping plain field values in ``$set``.
 
-        self.host = os.getenv("MONGO_HOST")
-        self.username = os.getenv("MONGO_INITDB_ROOT_USERNAME")
-        self.password = os.getenv("MONGO_INITDB_ROOT_PASSWORD")
-        self.database_name = os.getenv("MONGO_INITDB_DATABASE")
+    With ``is_update_op`` left as None, only the first key is inspected to detect operator documents.
+    """
+    if is_update_op is None:
+        is_update_op = next(iter(update_dict), "").startswith("$")
+    return update_dict if is_update_op else _set(update_dict)
 
-        # Handle port conversion with proper error handling
-        port_str = os.getenv("MONGO_PORT")
-        try:
-            self.port = int(port_str) if port_str and port_str.strip() else None
-        except ValueError:
-            raise OSError(f"Invalid MONGO_PORT value: '{port_str}'. Must be a valid integer.")
 
-        self._validate_env_vars()
+def parse_int_env(var_name: str, value: str) -> int:
+    """Parse the value of an integer environment variable, raising OSError if it is not an integer."""
+    try:
+        return int(value)
+    except ValueError:
+        raise OSError(f"Invalid {var_name} value: '{value}'. Must be a valid integer.")
 
-        self._client: Optional[MongoClient] = None
-        self._database: Optional[Database] = None
 
-        try:
-            self._connect()
-        except (ConnectionFailure, PyMongoError) as exc:
-            # Reset instance if connection fails
-            with self._lock:
-                DBClient._instance = None
-            logger.error(f"Error during MongoDB connection: {exc}")
-            raise
+def get_int_env(var_name: str) -> Optional[int]:
+    """Read an optional integer environment variable, raising OSError if it is set but not an integer."""
+    value = os.getenv(var_name)
+    return parse_int_env(var_name, value) if value and value.strip() else None
 
-        self._initialized = True
 
-    def _validate_env_vars(self):
-        """Validate that all required environment variables are set."""
-        required_vars = {
-            "MONGO_HOST": self.host,
-            "MONGO_PORT": self.port,
-            "MONGO_INITDB_ROOT_USERNAME": self.username,
-            "MONGO_INITDB_ROOT_PASSWORD": self.password,
-            "MONGO_INITDB_DATABASE": self.database_name,
-        }
+def get_required_env_vars(*var_names: str) -> dict[str, str]:
+    """Return the values of the given environment variables.
 
-        missing_vars = [var for var, value in required_vars.items() if value is None or value == ""]
+    Raises OSError listing every one that is unset or empty.
+    """
+    values = {}
+    missing_vars = []
+    for var_name in var_names:
+        value = os.getenv(var_name)
+        if value:
+            values[var_name] = value
+        else:
+            missing_vars.append(var_name)
+
+    if missing_vars:
+        raise OSError(
+            f"Missing required environment variables: {', '.join(missing_vars)}. " "Please check your .env file."
+        )
+    return values
+
+
+def build_connection_string(username: str, password: str, host: str, port: int) -> str:
+    """Build the MongoDB URI, URL-encoding username and password to handle special characters."""
+    return f"mongodb://{quote_plus(username)}:{quote_plus(password)}@{host}:{port}/"
+
+
+def client_options(
+    max_pool_size: Optional[int],
+    min_pool_size: Optional[int],
+    max_idle_time_ms: Optional[int],
+    wait_queue_timeout_ms: Optional[int],
+) -> dict[str, Any]:
+    """Build the keyword arguments shared by the sync and async MongoDB clients.
+
+    Unset pool options fall back to ``DEFAULT_POOL_OPTIONS``; a few warm connections are kept open so the first
+    operations skip the connection and authentication handshake, and pool checkouts fail fast instead of queueing.
+
+    Wire compression uses the first of ``MONGO_COMPRESSORS`` supported by both sides, defaulting to
+    ``DEFAULT_COMPRESSORS``; set it to an empty value to turn compression off.
+    """
+    pool_options = {
+        "maxPoolSize": max_pool_size,
+        "minPoolSize": min_pool_size,
+        "maxIdleTimeMS": max_idle_time_ms,
+        "waitQueueTimeoutMS": wait_queue_timeout_ms,
+    }
+    compressors = os.getenv("MONGO_COMPRESSORS", DEFAULT_COMPRESSORS)
+    return {
+        **DEFAULT_POOL_OPTIONS,
+        "serverSelectionTimeoutMS": 5000,
+        "connectTimeoutMS": 5000,
+        "socketTimeoutMS": 5000,
+        **({"compressors": compressors} if compressors else {}),
+        **{option: value for option, value in pool_options.items() if value is not None},
+    }
+
+
+class MongoSettings(NamedTuple):
+    """Connection settings shared by the sync and async clients, see ``load_mongo_settings``."""
+
+    host: str
+    port: int
+    database_name: str
+    connection_string: str
+    client_options: dict[str, Any]
+
+
+def load_mongo_settings() -> MongoSettings:
+    """Read the MongoDB connection settings from the environment.
+
+    Raises OSError if a required variable is missing or an integer variable is malformed. The optional
+    ``MONGO_*POOL*``/``MONGO_*_MS`` tuning variables fall back to ``DEFAULT_POOL_OPTIONS`` or the driver defaults.
+    """
+    env = get_required_env_vars(*REQUIRED_ENV_VARS)
+    host = env["MONGO_HOST"]
+    port = parse_int_env("MONGO_PORT", env["MONGO_PORT"])
+    return MongoSettings(
+        host=host,
+        port=port,
+        database_name=env["MONGO_INITDB_DATABASE"],
+        # Credentials are only kept URL-encoded inside the connection string
+        connection_string=build_connection_string(
+            env["MONGO_INITDB_ROOT_USERNAME"], env["MONGO_INITDB_ROOT_PASSWORD"], host, port
+        ),
+        client_options=client_options(
+            get_int_env("MONGO_MAX_POOL_SIZE"),
+            get_int_env("MONGO_MIN_POOL_SIZE"),
+            get_int_env("MONGO_MAX_IDLE_TIME_MS"),
+            get_int_env("MONGO_WAIT_QUEUE_TIMEOUT_MS"),
+        ),
+    )
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after they are stored."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize an empty cache holding at most ``maxsize`` entries."""
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Any:
+        """Return the cached value for ``key``, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def evict(self, predicate: Callable[[CacheKey], bool]) -> None:
+        """Remove every entry whose key satisfies ``predicate``."""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
 
-        if missing_vars:
-            raise OSError(
-                f"Missing required environment variables: {', '.join(missing_vars)}. " "Please check your .env file."
-            )
 
-    def _connect(self):
-        """Establish connection to MongoDB."""
-        try:
-            # URL-encode username and password to handle special characters
-            encoded_username = quote_plus(self.username) if self.username is not None else ""
-            encoded_password = quote_plus(self.password) if self.password is not None else ""
+class DBClient:
+    """Client for MongoDB CRUD operations.
 
-            connection_string = f"mongodb://{encoded_username}:{encoded_password}@{self.host}:{self.port}/"
-            self._client = MongoClient(
-                connection_string, serverSelectionTimeoutMS=5000, connectTimeoutMS=5000, socketTimeoutMS=5000
-            )
-            if self.database_name is None:
-                raise OSError("Database name must not be None")
-            self._database = self._client[self.database_name]
-            # Ping the server to ensure connection and authentication
-            self._client.admin.command("ping")
+    Provides thread-safe access to MongoDB with common CRUD operations. Use ``get_db_client()`` to share one
+    instance, and its connection pool, across the process; every ``DBClient()`` call builds its own pool.
+    Read-heavy processes can opt in to an in-process TTL cache for ``find_by_id`` with the ``MONGO_CACHE_SIZE``
+    and ``MONGO_CACHE_TTL_SECONDS`` environment variables, which the shared instance picks up as well.
+    """
+
+    __slots__ = (
+        "host",
+        "port",
+        "database_name",
+        "_settings",
+        "_client",
+        "_database",
+        "_collections",
+        "_cache",
+        "_connect_lock",
+    )
+
+    # Unique indexes on the natural keys; create them with ensure_indexes before bulk loads so duplicate inserts
+    # are rejected by the server
+    INDEXES = {
+        "users": [IndexModel([("employee_id", ASCENDING)], unique=True)],
+        "time_logs": [IndexModel([("employee_id", ASCENDING), ("date", ASCENDING)], unique=True)],
+    }
+
+    def __init__(self, cache_size: Optional[int] = None, cache_ttl: Optional[float] = None, validate: bool = False):
+        """Initialize the DBClient from environment variables.
+
+        No connection is made until the first operation needs the database, unless ``validate`` is set. The
+        shared ``get_db_client()`` instance always connects lazily.
+
+        Args:
+            cache_size: Maximum number of documents kept in the ``find_by_id`` cache, 0 disables caching.
+                Defaults to ``MONGO_CACHE_SIZE``, or 0 when unset.
+            cache_ttl: Number of seconds a cached document stays valid. Defaults to ``MONGO_CACHE_TTL_SECONDS``,
+                or 60 when unset.
+            validate: Ping the server during construction to fail fast on connection or authentication errors.
+        """
+        self._settings = settings = load_mongo_settings()
+        self.host = settings.host
+        self.port = settings.port
+        self.database_name = settings.database_name
+        self._client: Optional[MongoClient] = None
+        self._database: Optional[Database] = None
+        self._collections: dict[tuple[str, int], Collection] = {}
+        if cache_size is None:
+            cache_size = get_int_env("MONGO_CACHE_SIZE") or 0
+        if cache_ttl is None:
+            cache_ttl = get_int_env("MONGO_CACHE_TTL_SECONDS") or 60.0
+        self._cache: Optional[_TTLCache] = _TTLCache(cache_size, cache_ttl) if cache_size > 0 else None
+        self._connect_lock = threading.Lock()
+
+        if validate:
+            try:
+                self._connect(validate=True)
+            except (ConnectionFailure, PyMongoError) as exc:
+                logger.error("Error during MongoDB connection: %s", exc)
+                raise
+
+    def _connect(self, validate: bool = False) -> Database:
+        """Establish connection to MongoDB and return the database handle.
+
+        MongoClient connects lazily; the only round-trip made here is the optional ``validate`` ping.
+        """
+        try:
+            self._client = MongoClient(self._settings.connection_string, **self._settings.client_options)
+            self._database = database = self._client[self.database_name]
+            if validate:
+                # Ping the server to ensure connection and authentication
+                self._client.admin.command("ping")
 
         except ConnectionFailure as exc:
-            logger.error(f"Failed to connect to MongoDB: {exc}")
+            logger.error("Failed to connect to MongoDB: %s", exc)
             raise
         except PyMongoError as exc:
-            logger.error(f"MongoDB error during connection: {exc}")
+            logger.error("MongoDB error during connection: %s", exc)
             raise
 
-    def get_collection(self, collection_name: str) -> Collection:
-        """Get a collection from the database."""
-        if self._database is None:
-            raise RuntimeError("Database connection not established")
-        return self._database[collection_name]
+        return database
+
+    def _get_database(self) -> Database:
+        """Return the database handle, connecting to MongoDB on first use."""
+        database = self._database
+        if database is None:
+            with self._connect_lock:
+                database = self._database
+                if database is None:
+                    database = self._connect()
+        return database
+
+    def get_collection(self, collection_name: str, codec_options: Optional[CodecOptions] = None) -> Collection:
+        """Get a collection from the database.
+
+        Collection handles are cached per name and codec options, so repeated CRUD calls reuse the same
+        thread-safe handle. ``codec_options`` defaults to ``CODEC_OPTIONS``; pass a long-lived module-level
+        instance rather than building one per call, as the cache is keyed on its identity.
+        """
+        codec_options = codec_options or CODEC_OPTIONS
+        # CodecOptions is not hashable; the cached Collection keeps the instance alive, so its id() stays unique
+        cache_key = (collection_name, id(codec_options))
+        collection = self._collections.get(cache_key)
+        if collection is None:
+            # Under the lock so a concurrent close_connection cannot leave a handle to the closed client cached
+            with self._connect_lock:
+                collection = self._collections.get(cache_key)
+                if collection is None:
+                    database = self._database
+                    if database is None:
+                        database = self._connect()
+                    collection = self._collections[cache_key] = database.get_collection(
+                        collection_name, codec_options=codec_options
+                    )
+        return collection
 
     def close_connection(self):
-        """Close the MongoDB connection."""
-        if self._client:
-            self._client.close()
-            logger.info("MongoDB connection closed")
+        """Close the MongoDB connection; the next operation reconnects."""
+        with self._connect_lock:
+            if self._client:
+                self._collections.clear()
+                if self._cache is not None:
+                    self._cache.clear()
+                self._client.close()
+                self._client = None
+                self._database = None
+                logger.info("MongoDB connection closed")
+
+    def invalidate(self, collection_name: str, document_id: Optional[str] = None):
+        """Drop cached ``find_by_id`` results for a document, or for the whole collection if no ID is given."""
+        if self._cache is None:
+            return
+        if document_id is None:
+            self._cache.evict(lambda key: key[0] == collection_name)
+        else:
+            document_id = str(document_id).lower()
+            self._cache.evict(lambda key: key[0] == collection_name and key[1] == document_id)
+
+    def _invalidate_matching(self, collection_name: str, filter_dict: dict[str, Any]):
+        """Drop cached results that a write using ``filter_dict`` may have touched."""
+        if self._cache is None:
+            return
+        if len(filter_dict) == 1 and isinstance(filter_dict.get("_id"), (ObjectId, str)):
+            self.invalidate(collection_name, filter_dict["_id"])
+        else:
+            self.invalidate(collection_name)
 
     # CREATE operations
     def insert_one(self, collection_name: str, document: dict[str, Any]) -> str:
@@ -137,125 +403,233 @@ class DBClient:
             result = collection.insert_one(document)
             return str(result.inserted_id)
         except PyMongoError as exc:
-            logger.error(f"Error inserting document: {exc}")
+            logger.error("Error inserting document: %s", exc)
             raise
 
-    def insert_many(self, collection_name: str, documents: list[dict[str, Any]]) -> list[str]:
-        """Insert multiple documents into the collection."""
+    def insert_many(
+        self,
+        collection_name: str,
+        documents: list[dict[str, Any]],
+        ordered: bool = False,
+        bypass_document_validation: bool = False,
+        write_concern: Optional[WriteConcern] = None,
+    ) -> list[str]:
+        """Insert multiple documents into the collection.
+
+        Inserts are unordered by default so the server can apply them in parallel and a single failing document
+        does not abort the rest of the batch. Pass a ``write_concern`` to trade durability for throughput.
+        """
         try:
             collection = self.get_collection(collection_name)
-            result = collection.insert_many(documents)
-            return [str(id) for id in result.inserted_ids]
+            if write_concern is not None:
+                collection = collection.with_options(write_concern=write_concern)
+            result = collection.insert_many(
+                documents, ordered=ordered, bypass_document_validation=bypass_document_validation
+            )
+            return list(map(str, result.inserted_ids))
         except PyMongoError as exc:
-            logger.error(f"Error inserting documents: {exc}")
+            logger.error("Error inserting documents: %s", exc)
             raise
 
     # READ operations
-    def find_one(self, collection_name: str, filter_dict: Optional[dict[str, Any]] = None) -> Optional[dict[str, Any]]:
-        """Find a single document in the collection."""
+    def find_one(
+        self,
+        collection_name: str,
+        filter_dict: Optional[dict[str, Any]] = None,
+        projection: Optional[Projection] = None,
+    ) -> Optional[dict[str, Any]]:
+        """Find a single document in the collection.
+
+        Pass a ``projection`` such as ``{"field": 1, "_id": 0}`` to fetch only the fields you need.
+        """
         try:
             collection = self.get_collection(collection_name)
-            result = collection.find_one(filter_dict or {})
+            result = collection.find_one(filter_dict or {}, projection)
             if result and "_id" in result:
                 result["_id"] = str(result["_id"])
             return result
         except PyMongoError as exc:
-            logger.error(f"Error finding document: {exc}")
+            logger.error("Error finding document: %s", exc)
             raise
 
-    def find_by_id(self, collection_name: str, document_id: str) -> Optional[dict[str, Any]]:
-        """Find a document by its ObjectId."""
+    def find_by_id(
+        self, collection_name: str, document_id: Union[str, ObjectId], projection: Optional[Projection] = None
+    ) -> Optional[dict[str, Any]]:
+        """Find a document by its ObjectId, optionally restricted to the fields in ``projection``."""
         try:
+            object_id = to_object_id(document_id)
+            cache_key = (collection_name, str(object_id), None if projection is None else repr(projection))
+            if self._cache is not None:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return copy.deepcopy(cached)
+
             collection = self.get_collection(collection_name)
-            result = collection.find_one({"_id": ObjectId(document_id)})
-            if result:
-                result["_id"] = str(result["_id"])
+            result = collection.find_one({"_id": object_id}, projection)
+            if result is not None:
+                if "_id" in result:
+                    result["_id"] = str(result["_id"])
+                if self._cache is not None:
+                    # Deep copies on both sides keep caller mutations of nested values out of the cache
+                    self._cache.set(cache_key, copy.deepcopy(result))
             return result
         except InvalidId as exc:
-            logger.error(f"Invalid ObjectId format: {exc}")
+            logger.error("Invalid ObjectId format: %s", exc)
             raise
         except PyMongoError as exc:
-            logger.error(f"Error finding document by ID: {exc}")
+            logger.error("Error finding document by ID: %s", exc)
             raise
 
-    def find_many(
+    def iter_many(
         self,
         collection_name: str,
         filter_dict: Optional[dict[str, Any]] = None,
         limit: Optional[int] = None,
         skip: Optional[int] = None,
-    ) -> list[dict[str, Any]]:
-        """Find multiple documents in the collection."""
+        stringify_ids: bool = True,
+        batch_size: Optional[int] = None,
+        raw: bool = False,
+        projection: Optional[Projection] = None,
+    ) -> Iterator[Mapping[str, Any]]:
+        """Yield matching documents as the cursor streams them, holding at most one batch in memory.
+
+        The first document is available as soon as the first batch arrives, and the cursor is closed when the
+        generator is exhausted or closed.
+
+        Pass ``stringify_ids=False`` to keep ``_id`` as an ``ObjectId`` and skip the per-document conversion.
+        ``batch_size`` sets how many documents each server round-trip returns: smaller values bound memory,
+        larger values cut getMore round-trips on large scans. Leave it unset to use the driver's native batching.
+        Pass ``raw=True`` to get undecoded, read-only ``RawBSONDocument`` objects back instead of dicts, e.g. when
+        the documents are only forwarded; ``_id`` is then left untouched. A ``projection`` such as
+        ``{"field": 1, "_id": 0}`` limits the returned fields, which also skips the ``_id`` conversion.
+        """
         try:
-            collection = self.get_collection(collection_name)
-            cursor = collection.find(filter_dict or {})
+            collection = self.get_collection(collection_name, RAW_CODEC_OPTIONS if raw else None)
+            cursor = collection.find(filter_dict or {}, projection)
 
             if skip:
                 cursor = cursor.skip(skip)
             if limit:
                 cursor = cursor.limit(limit)
-
-            results = []
-            for doc in cursor:
-                if "_id" in doc:
-                    doc["_id"] = str(doc["_id"])
-                results.append(doc)
-            return results
+            if batch_size:
+                cursor = cursor.batch_size(batch_size)
+
+            # Closing the generator early (break, close(), garbage collection) also kills the server-side cursor
+            with cursor:
+                if not stringify_ids or raw:
+                    yield from cursor
+                    return
+                for doc in cursor:
+                    if "_id" in doc:
+                        doc["_id"] = str(doc["_id"])
+                    yield doc
         except PyMongoError as exc:
-            logger.error(f"Error finding documents: {exc}")
+            logger.error("Error finding documents: %s", exc)
             raise
 
+    def find_many(
+        self,
+        collection_name: str,
+        filter_dict: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        skip: Optional[int] = None,
+        stringify_ids: bool = True,
+        batch_size: Optional[int] = None,
+        raw: bool = False,
+        projection: Optional[Projection] = None,
+    ) -> list[Mapping[str, Any]]:
+        """Find multiple documents in the collection.
+
+        Accepts the same arguments as ``iter_many``; prefer ``iter_many`` for large result sets.
+        """
+        return list(
+            self.iter_many(collection_name, filter_dict, limit, skip, stringify_ids, batch_size, raw, projection)
+        )
+
     def count_documents(self, collection_name: str, filter_dict: Optional[dict[str, Any]] = None) -> int:
-        """Count documents in the collection."""
+        """Count documents in the collection.
+
+        Without a filter the count comes from collection metadata (see ``estimated_document_count``), which
+        avoids a full scan but may drift after an unclean shutdown or on sharded clusters with orphaned documents.
+        """
+        try:
+            collection = self.get_collection(collection_name)
+            if not filter_dict:
+                return collection.estimated_document_count()
+            return collection.count_documents(filter_dict)
+        except PyMongoError as exc:
+            logger.error("Error counting documents: %s", exc)
+            raise
+
+    def estimated_document_count(self, collection_name: str) -> int:
+        """Count all documents in the collection from its metadata, without scanning it."""
         try:
             collection = self.get_collection(collection_name)
-            return collection.count_documents(filter_dict or {})
+            return collection.estimated_document_count()
         except PyMongoError as exc:
-            logger.error(f"Error counting documents: {exc}")
+            logger.error("Error estimating document count: %s", exc)
             raise
 
     # UPDATE operations
     def update_one(
-        self, collection_name: str, filter_dict: dict[str, Any], update_dict: dict[str, Any], upsert: bool = False
+        self,
+        collection_name: str,
+        filter_dict: dict[str, Any],
+        update_dict: dict[str, Any],
+        upsert: bool = False,
+        is_update_op: Optional[bool] = None,
     ) -> bool:
-        """Update a single document in the collection."""
+        """Update a single document in the collection.
+
+        Plain field values are wrapped in ``$set``. Pass ``is_update_op=True`` for documents already rooted at
+        update operators, or False for plain field values, to skip the detection.
+        """
         try:
             collection = self.get_collection(collection_name)
-
-            # Ensure update operations are properly formatted
-            if not any(key.startswith("$") for key in update_dict.keys()):
-                update_dict = {"$set": update_dict}
-
-            result = collection.update_one(filter_dict, update_dict, upsert=upsert)
+            result = collection.update_one(filter_dict, as_update(update_dict, is_update_op), upsert=upsert)
+            self._invalidate_matching(collection_name, filter_dict)
             return result.modified_count > 0 or result.upserted_id is not None
         except PyMongoError as exc:
-            logger.error(f"Error updating document: {exc}")
+            logger.error("Error updating document: %s", exc)
             raise
 
-    def update_by_id(self, collection_name: str, document_id: str, update_dict: dict[str, Any]) -> bool:
+    def update_by_id(
+        self,
+        collection_name: str,
+        document_id: Union[str, ObjectId],
+        update_dict: dict[str, Any],
+        is_update_op: Optional[bool] = None,
+    ) -> bool:
         """Update a document by its ObjectId."""
         try:
-            return self.update_one(collection_name, {"_id": ObjectId(document_id)}, update_dict)
+            return self.update_one(
+                collection_name, {"_id": to_object_id(document_id)}, update_dict, is_update_op=is_update_op
+            )
         except InvalidId as exc:
-            logger.error(f"Invalid ObjectId format: {exc}")
+            logger.error("Invalid ObjectId format: %s", exc)
             raise
         except PyMongoError as exc:
-            logger.error(f"Error updating document by ID: {exc}")
+            logger.error("Error updating document by ID: %s", exc)
             raise
 
-    def update_many(self, collection_name: str, filter_dict: dict[str, Any], update_dict: dict[str, Any]) -> int:
-        """Update multiple documents in the collection."""
+    def update_many(
+        self,
+        collection_name: str,
+        filter_dict: dict[str, Any],
+        update_dict: dict[str, Any],
+        is_update_op: Optional[bool] = None,
+    ) -> int:
+        """Update multiple documents in the collection.
+
+        ``is_update_op`` works as in ``update_one``.
+        """
         try:
             collection = self.get_collection(collection_name)
-
-            # Ensure update operations are properly formatted
-            if not any(key.startswith("$") for key in update_dict.keys()):
-                update_dict = {"$set": update_dict}
-
-            result = collection.update_many(filter_dict, update_dict)
+            result = collection.update_many(filter_dict, as_update(update_dict, is_update_op))
+            self.invalidate(collection_name)
             return result.modified_count
         except PyMongoError as exc:
-            logger.error(f"Error updating documents: {exc}")
+            logger.error("Error updating documents: %s", exc)
             raise
 
     # DELETE operations
@@ -264,20 +638,21 @@ class DBClient:
         try:
             collection = self.get_collection(collection_name)
             result = collection.delete_one(filter_dict)
+            self._invalidate_matching(collection_name, filter_dict)
             return result.deleted_count > 0
         except PyMongoError as exc:
-            logger.error(f"Error deleting document: {exc}")
+            logger.error("Error deleting document: %s", exc)
             raise
 
-    def delete_by_id(self, collection_name: str, document_id: str) -> bool:
+    def delete_by_id(self, collection_name: str, document_id: Union[str, ObjectId]) -> bool:
         """Delete a document by its ObjectId."""
         try:
-            return self.delete_one(collection_name, {"_id": ObjectId(document_id)})
+            return self.delete_one(collection_name, {"_id": to_object_id(document_id)})
         except InvalidId as exc:
-            logger.error(f"Invalid ObjectId format: {exc}")
+            logger.error("Invalid ObjectId format: %s", exc)
             raise
         except PyMongoError as exc:
-            logger.error(f"Error deleting document by ID: {exc}")
+            logger.error("Error deleting document by ID: %s", exc)
             raise
 
     def delete_many(self, collection_name: str, filter_dict: dict[str, Any]) -> int:
@@ -285,9 +660,28 @@ class DBClient:
         try:
             collection = self.get_collection(collection_name)
             result = collection.delete_many(filter_dict)
+            self.invalidate(collection_name)
             return result.deleted_count
         except PyMongoError as exc:
-            logger.error(f"Error deleting documents: {exc}")
+            logger.error("Error deleting documents: %s", exc)
+            raise
+
+    # BULK operations
+    def bulk_write(
+        self, collection_name: str, operations: list[WriteOperation], ordered: bool = False
+    ) -> BulkWriteResult:
+        """Apply a mix of insert, update, replace and delete operations in a single batch.
+
+        Build the operations with pymongo's ``InsertOne``, ``UpdateOne``, ``DeleteOne`` etc. so each one is
+        encoded only once by the driver and sent in as few round-trips as possible.
+        """
+        try:
+            collection = self.get_collection(collection_name)
+            result = collection.bulk_write(operations, ordered=ordered)
+            self.invalidate(collection_name)
+            return result
+        except PyMongoError as exc:
+            logger.error("Error executing bulk write: %s", exc)
             raise
 
     # Utility methods
@@ -296,17 +690,61 @@ class DBClient:
         try:
             collection = self.get_collection(collection_name)
             collection.drop()
+            for cache_key in [cache_key for cache_key in self._collections if cache_key[0] == collection_name]:
+                del self._collections[cache_key]
+            self.invalidate(collection_name)
             return True
         except PyMongoError as exc:
-            logger.error(f"Error dropping collection: {exc}")
+            logger.error("Error dropping collection: %s", exc)
+            raise
+
+    def ensure_indexes(self, collection_name: str, models: list[IndexModel]) -> list[str]:
+        """Create the given indexes in one batch and return their names.
+
+        Safe to call at every startup: indexes that already exist with the same specification are left as is.
+        """
+        if not models:
+            return []
+        try:
+            collection = self.get_collection(collection_name)
+            return collection.create_indexes(models)
+        except PyMongoError as exc:
+            logger.error("Error creating indexes: %s", exc)
             raise
 
     def list_collections(self) -> list[str]:
         """List all collections in the database."""
         try:
-            if self._database is None:
-                raise RuntimeError("Database connection not established")
-            return self._database.list_collection_names()
+            return self._get_database().list_collection_names()
         except PyMongoError as exc:
-            logger.error(f"Error listing collections: {exc}")
+            logger.error("Error listing collections: %s", exc)
             raise
+
+
+_db_client: Optional[DBClient] = None
+_db_client_lock = threading.Lock()
+
+
+def get_db_client() -> DBClient:
+    """Return the process-wide DBClient, creating it on first call.
+
+    Construction is serialized so concurrent first calls share one instance and one connection pool. A failed
+    construction is not stored, so the next call retries.
+    """
+    global _db_client
+    db_client = _db_client
+    if db_client is None:
+        with _db_client_lock:
+            db_client = _db_client
+            if db_client is None:
+                db_client = _db_client = DBClient()
+    return db_client
+
+
+def reset_db_client():
+    """Close the process-wide DBClient so the next ``get_db_client()`` call builds a fresh one, e.g. between tests."""
+    global _db_client
+    with _db_client_lock:
+        db_client, _db_client = _db_client, None
+    if db_client is not None:
+        db_client.close_connection()
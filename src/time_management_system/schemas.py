@@ -1,6 +1,5 @@
 """Pydantic models and schema validation for the rdo-time-management-system project."""
 
-import re
 from datetime import date as dt_date
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
@@ -42,6 +41,17 @@ class TimeLogModel(BaseModel):
             >>> TimeLogModel.validate_time_format("25:00")
             ValueError: Time must be in HH:MM 24-hour format
         """
-        if not re.match(r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$", time_value):
+        hours, separator, minutes = time_value.partition(":")
+        if not (
+            separator
+            and 1 <= len(hours) <= 2
+            and len(minutes) == 2
+            and hours.isascii()
+            and hours.isdigit()
+            and minutes.isascii()
+            and minutes.isdigit()
+            and int(hours) <= 23
+            and int(minutes) <= 59
+        ):
             raise ValueError("Time must be in HH:MM 24-hour format")
         return time_value
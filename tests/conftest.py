@@ -0,0 +1,15 @@
+"""Shared fixtures for the TMS test suite."""
+
+import pytest
+
+
+@pytest.fixture
+def mongo_env(monkeypatch):
+    for var_name, value in {
+        "MONGO_HOST": "localhost",
+        "MONGO_PORT": "27017",
+        "MONGO_INITDB_ROOT_USERNAME": "user",
+        "MONGO_INITDB_ROOT_PASSWORD": "secret",
+        "MONGO_INITDB_DATABASE": "tms",
+    }.items():
+        monkeypatch.setenv(var_name, value)
@@ -0,0 +1,61 @@
+"""Test async database module for TMS project."""
+
+import asyncio
+
+import pytest
+
+from time_management_system import async_database
+from time_management_system.async_database import AsyncDBClient, get_async_db_client, reset_async_db_client
+
+
+@pytest.fixture
+def async_db_client(mongo_env):
+    return AsyncDBClient()
+
+
+@pytest.mark.asyncio
+async def test_get_collection_reuses_one_client_per_loop(async_db_client):
+    users = async_db_client.get_collection("users")
+
+    assert async_db_client.get_collection("users") is users
+    assert async_db_client.get_collection("time_logs").database is users.database
+    assert async_db_client.get_database() is users.database
+    assert len(async_db_client._connections) == 1
+    await async_db_client.close_connection()
+
+
+def test_closed_loops_are_pruned(async_db_client):
+    async def get_client():
+        return async_db_client.get_database().client
+
+    clients = [asyncio.run(get_client()) for _ in range(3)]
+
+    assert len({id(client) for client in clients}) == 3
+    assert list(async_db_client._connections.values())[0].client is clients[-1]
+    assert len(async_db_client._connections) == 1
+
+
+@pytest.mark.asyncio
+async def test_close_connection_drops_the_running_loop_client(async_db_client):
+    users = async_db_client.get_collection("users")
+    await async_db_client.close_connection()
+
+    assert async_db_client._connections == {}
+    reopened = async_db_client.get_collection("users")
+    assert reopened is not users
+    assert reopened.database.client is not users.database.client
+    await async_db_client.close_connection()
+    await async_db_client.close_connection()
+
+
+@pytest.mark.asyncio
+async def test_get_async_db_client_shares_one_instance(mongo_env, monkeypatch):
+    monkeypatch.setattr(async_database, "_async_db_client", None)
+    db_client = get_async_db_client()
+    assert get_async_db_client() is db_client
+    db_client.get_collection("users")
+
+    await reset_async_db_client()
+    assert db_client._connections == {}
+    assert get_async_db_client() is not db_client
+    await reset_async_db_client()
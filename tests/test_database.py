@@ -1 +1,273 @@
 """Test database module for TMS project."""
+
+import threading
+import time
+
+import pytest
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from time_management_system import database
+from time_management_system.database import (
+    CODEC_OPTIONS,
+    DBClient,
+    _TTLCache,
+    as_update,
+    get_db_client,
+    reset_db_client,
+    to_object_id,
+)
+
+OID = "64b7f0c2a1b2c3d4e5f60718"
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeCollection:
+    """Collection double serving find_one from a fixed document and counting the calls."""
+
+    def __init__(self, document):
+        self.document = document
+        self.calls = 0
+
+    def find_one(self, filter_dict, projection=None):
+        self.calls += 1
+        return dict(self.document, _id=str(filter_dict["_id"]))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(database.time, "monotonic", fake_clock)
+    return fake_clock
+
+
+@pytest.fixture
+def db_client(mongo_env):
+    return DBClient(cache_size=8, cache_ttl=60.0)
+
+
+def test_ttl_cache_expires_entries(clock):
+    cache = _TTLCache(maxsize=2, ttl=10.0)
+    cache.set(("users", OID, None), "value")
+    clock.now = 9.9
+    assert cache.get(("users", OID, None)) == "value"
+    clock.now = 10.0
+    assert cache.get(("users", OID, None)) is None
+
+
+def test_ttl_cache_evicts_least_recently_used(clock):
+    cache = _TTLCache(maxsize=2, ttl=10.0)
+    cache.set(("users", "a", None), 1)
+    cache.set(("users", "b", None), 2)
+    cache.get(("users", "a", None))
+    cache.set(("users", "c", None), 3)
+    assert cache.get(("users", "a", None)) == 1
+    assert cache.get(("users", "b", None)) is None
+    assert cache.get(("users", "c", None)) == 3
+
+
+def test_ttl_cache_evict_and_clear(clock):
+    cache = _TTLCache(maxsize=4, ttl=10.0)
+    for key in [("users", "a", None), ("users", "b", "['email']"), ("time_logs", "a", None)]:
+        cache.set(key, key)
+    cache.evict(lambda key: key[0] == "users")
+    assert cache.get(("users", "a", None)) is None
+    assert cache.get(("users", "b", "['email']")) is None
+    assert cache.get(("time_logs", "a", None)) == ("time_logs", "a", None)
+    cache.clear()
+    assert cache.get(("time_logs", "a", None)) is None
+
+
+@pytest.mark.parametrize(
+    "update_dict, is_update_op, expected",
+    [
+        ({"active": False}, None, {"$set": {"active": False}}),
+        ({"$inc": {"active_hours": 1}}, None, {"$inc": {"active_hours": 1}}),
+        ({}, None, {"$set": {}}),
+        ({"$weird": 1}, False, {"$set": {"$weird": 1}}),
+        ({"active": False}, True, {"active": False}),
+    ],
+)
+def test_as_update(update_dict, is_update_op, expected):
+    assert as_update(update_dict, is_update_op) == expected
+
+
+def test_to_object_id_accepts_hex_strings_and_object_ids():
+    object_id = ObjectId(OID)
+    assert to_object_id(OID) == object_id
+    assert to_object_id(OID.upper()) == object_id
+    assert to_object_id(object_id) is object_id
+
+
+@pytest.mark.parametrize("document_id", ["", OID[:-1], OID + "0", "z" * 24, " " + OID[1:], None, 42])
+def test_to_object_id_rejects_invalid_ids(document_id):
+    with pytest.raises(InvalidId):
+        to_object_id(document_id)
+
+
+class UpdateResult:
+    modified_count = 1
+    upserted_id = None
+
+
+class RecordingCollection(FakeCollection):
+    """FakeCollection that also records the filters passed to update_one."""
+
+    def __init__(self, document):
+        super().__init__(document)
+        self.update_filters = []
+
+    def update_one(self, filter_dict, update, upsert=False):
+        self.update_filters.append(filter_dict)
+        return UpdateResult()
+
+
+def test_by_id_methods_accept_object_ids(db_client):
+    users = RecordingCollection({"name": "user"})
+    db_client._collections[("users", id(CODEC_OPTIONS))] = users
+    object_id = ObjectId(OID)
+
+    assert db_client.find_by_id("users", object_id) == {"name": "user", "_id": OID}
+    assert db_client.find_by_id("users", OID) == {"name": "user", "_id": OID}
+    assert users.calls == 1
+    assert db_client.update_by_id("users", object_id, {"name": "renamed"})
+    assert users.update_filters == [{"_id": object_id}]
+
+
+def test_close_connection_drops_cached_collections(db_client):
+    users = db_client.get_collection("users")
+    assert db_client.get_collection("users") is users
+
+    db_client.close_connection()
+    reopened = db_client.get_collection("users")
+
+    assert reopened is not users
+    assert reopened.database.client is db_client._client
+    db_client.close_connection()
+
+
+class ObjectIdCollection:
+    """Collection double returning documents whose ``_id`` and reference field are ObjectIds."""
+
+    def find_one(self, filter_dict, projection=None):
+        return {"_id": ObjectId(OID), "manager_id": ObjectId(OID)}
+
+
+def test_reads_stringify_only_the_id(db_client):
+    db_client._collections[("users", id(CODEC_OPTIONS))] = ObjectIdCollection()
+    for document in [db_client.find_one("users"), db_client.find_by_id("users", OID)]:
+        assert document["_id"] == OID
+        assert document["manager_id"] == ObjectId(OID)
+
+
+def test_find_by_id_cache_is_isolated_from_caller_mutations(db_client):
+    collection = FakeCollection({"tags": ["a"]})
+    db_client._collections[("users", id(CODEC_OPTIONS))] = collection
+
+    first = db_client.find_by_id("users", OID)
+    first["tags"].append("b")
+    second = db_client.find_by_id("users", OID)
+    second["tags"].append("c")
+
+    assert db_client.find_by_id("users", OID)["tags"] == ["a"]
+    assert collection.calls == 1
+
+
+def test_invalidate_drops_one_document_or_whole_collection(db_client):
+    users = FakeCollection({"name": "user"})
+    time_logs = FakeCollection({"name": "log"})
+    db_client._collections[("users", id(CODEC_OPTIONS))] = users
+    db_client._collections[("time_logs", id(CODEC_OPTIONS))] = time_logs
+    other_oid = str(ObjectId())
+    for collection_name, document_id in [("users", OID), ("users", other_oid), ("time_logs", OID)]:
+        db_client.find_by_id(collection_name, document_id)
+
+    db_client.invalidate("users", OID.upper())
+    db_client.find_by_id("users", OID)
+    db_client.find_by_id("users", other_oid)
+    assert users.calls == 3
+
+    db_client.invalidate("users")
+    db_client.find_by_id("users", other_oid)
+    db_client.find_by_id("time_logs", OID)
+    assert users.calls == 4
+    assert time_logs.calls == 1
+
+
+@pytest.mark.parametrize(
+    "filter_dict, refetched",
+    [
+        ({"_id": ObjectId(OID)}, 1),
+        ({"_id": OID}, 1),
+        ({"_id": OID, "active": True}, 2),
+        ({"employee_id": "E001"}, 2),
+    ],
+)
+def test_invalidate_matching(db_client, filter_dict, refetched):
+    users = FakeCollection({"name": "user"})
+    db_client._collections[("users", id(CODEC_OPTIONS))] = users
+    document_ids = [OID, str(ObjectId())]
+    for document_id in document_ids:
+        db_client.find_by_id("users", document_id)
+
+    db_client._invalidate_matching("users", filter_dict)
+    for document_id in document_ids:
+        db_client.find_by_id("users", document_id)
+
+    assert users.calls == 2 + refetched
+
+
+class SlowDBClient:
+    """DBClient double whose construction is slow enough for concurrent first calls to overlap."""
+
+    instances = 0
+
+    def __init__(self):
+        time.sleep(0.05)
+        SlowDBClient.instances += 1
+
+    def close_connection(self):
+        pass
+
+
+def test_get_db_client_builds_one_instance_under_concurrent_first_calls(monkeypatch):
+    monkeypatch.setattr(database, "DBClient", SlowDBClient)
+    monkeypatch.setattr(database, "_db_client", None)
+    barrier = threading.Barrier(4)
+    db_clients = []
+
+    def first_call():
+        barrier.wait()
+        db_clients.append(get_db_client())
+
+    threads = [threading.Thread(target=first_call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert SlowDBClient.instances == 1
+    assert all(db_client is db_clients[0] for db_client in db_clients)
+
+    reset_db_client()
+    assert get_db_client() is not db_clients[0]
+
+
+def test_find_by_id_cache_is_configured_from_the_environment(mongo_env, monkeypatch):
+    assert DBClient()._cache is None
+
+    monkeypatch.setenv("MONGO_CACHE_SIZE", "100")
+    monkeypatch.setenv("MONGO_CACHE_TTL_SECONDS", "5")
+    cache = DBClient()._cache
+    assert cache is not None
+    assert (cache._maxsize, cache._ttl) == (100, 5)
+    assert DBClient(cache_size=0)._cache is None
@@ -0,0 +1,51 @@
+"""Test schemas module for TMS project."""
+
+import re
+from itertools import product
+
+import pytest
+
+from time_management_system.schemas import TimeLogModel
+
+# The pattern validate_time_format replaced, anchored at both ends
+OLD_TIME_PATTERN = re.compile(r"([01]?[0-9]|2[0-3]):[0-5][0-9]")
+
+
+def is_valid_time(time_value: str) -> bool:
+    try:
+        TimeLogModel.validate_time_format(time_value)
+    except ValueError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "time_value, expected",
+    [
+        ("00:00", True),
+        ("9:30", True),
+        ("09:30", True),
+        ("23:59", True),
+        ("24:00", False),
+        ("12:60", False),
+        ("123:00", False),
+        ("12:5", False),
+        ("12-30", False),
+        (":30", False),
+        ("", False),
+        ("+1:30", False),
+        (" 1:30", False),
+        ("１２:30", False),
+        ("12:30\n", False),
+    ],
+)
+def test_validate_time_format_boundaries(time_value, expected):
+    assert is_valid_time(time_value) is expected
+
+
+def test_validate_time_format_matches_old_pattern():
+    alphabet = "0123456789:１\n"
+    for length in range(6):
+        for chars in product(alphabet, repeat=length):
+            time_value = "".join(chars)
+            assert is_valid_time(time_value) is bool(OLD_TIME_PATTERN.fullmatch(time_value)), time_value
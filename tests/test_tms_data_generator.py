@@ -0,0 +1,90 @@
+"""Test the TMS data generator seeding logic against an in-memory DB double."""
+
+import logging
+
+import pytest
+from pymongo.errors import BulkWriteError, OperationFailure
+
+from tests import tms_data_generator
+from tests.tms_data_generator import TMSDataGenerator
+
+
+class FakeDB:
+    """DBClient double recording inserts, optionally failing index creation or raising a bulk write error."""
+
+    def __init__(self, bulk_write_error=None, index_error=None):
+        self.bulk_write_error = bulk_write_error
+        self.index_error = index_error
+        self.inserted = {}
+        self.closed = False
+
+    def ensure_indexes(self, collection_name, models):
+        if self.index_error is not None:
+            raise self.index_error
+        return []
+
+    def insert_many(self, collection_name, documents, ordered=False):
+        if self.bulk_write_error is not None:
+            raise self.bulk_write_error
+        self.inserted.setdefault(collection_name, []).extend(documents)
+        return ["x"] * len(documents)
+
+    def close_connection(self):
+        self.closed = True
+
+
+@pytest.fixture
+def make_generator(monkeypatch):
+    def make(db):
+        monkeypatch.setattr(tms_data_generator, "get_db_client", lambda: db)
+        return TMSDataGenerator()
+
+    return make
+
+
+def test_insert_batches_counts_bulk_write_errors(make_generator, caplog):
+    timelog = {"employee_id": "E001", "date": "2025-06-01"}
+    bulk_write_error = BulkWriteError(
+        {
+            "nInserted": 2,
+            "writeErrors": [
+                {"index": 0, "code": 11000, "errmsg": "E11000 duplicate key error", "op": timelog},
+                {"index": 1, "code": 11000, "errmsg": "E11000 duplicate key error", "op": timelog},
+                {"index": 2, "code": 121, "errmsg": "Document failed validation", "op": timelog},
+            ],
+        }
+    )
+    generator = make_generator(FakeDB(bulk_write_error=bulk_write_error))
+
+    with caplog.at_level(logging.DEBUG):
+        assert generator._insert_batches("time_logs", [dict(timelog) for _ in range(5)])
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert "Inserted 2 documents into time_logs, 2 skipped as duplicates, 1 failed" in messages
+    assert "Document with employee_id=E001, date=2025-06-01 already exists in time_logs. Skipping." in messages
+    assert "MongoDB error inserting into time_logs: Document failed validation" in messages
+
+
+def test_run_stops_when_existing_duplicates_block_the_unique_index(make_generator, caplog):
+    db = FakeDB(index_error=OperationFailure("E11000 duplicate key error", code=11000))
+    generator = make_generator(db)
+
+    assert generator.run() is False
+    assert db.inserted == {}
+    assert db.closed
+    assert any("already holds duplicate documents" in record.getMessage() for record in caplog.records)
+
+
+def minute_of_day(clock_time):
+    hours, minutes = clock_time.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def test_generate_timelogs_active_hours_match_login_and_logout(make_generator):
+    generator = make_generator(FakeDB())
+    timelogs = generator.generate_timelogs(generator.generate_users())
+
+    assert len(timelogs) == generator.USER_COUNT * generator.TIMELOGS_PER_USER
+    for timelog in timelogs:
+        shift_minutes = minute_of_day(timelog["logout_time"]) - minute_of_day(timelog["login_time"])
+        assert timelog["active_hours"] == round(shift_minutes / 60, 1), timelog
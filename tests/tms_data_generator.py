@@ -1,20 +1,29 @@
 """Generate and seed MongoDB with dummy user and time log data using Faker."""
 
+import logging
+import random
 from datetime import date, timedelta
 
 from faker import Faker
-from pydantic import ValidationError
-from pymongo.errors import PyMongoError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
 
-from time_management_system.database import DBClient
+from time_management_system.database import DBClient, get_db_client
 from time_management_system.logger import get_logger
 from time_management_system.schemas import TimeLogModel, UserModel
 
+USERS_ADAPTER = TypeAdapter(list[UserModel])
+TIMELOGS_ADAPTER = TypeAdapter(list[TimeLogModel])
+
 
 class TMSDataGenerator:
     """Generate and seed MongoDB with dummy user and time log data using Faker."""
 
+    USER_COUNT = 501
+    EMPLOYEE_IDS = [f"E{user_index:03d}" for user_index in range(1, USER_COUNT + 1)]
     TIMELOGS_PER_USER = 10
+    INSERT_BATCH_SIZE = 1000
+    DUPLICATE_KEY_ERROR = 11000
     DEPARTMENTS = [
         "Compositing",
         "Lighting",
@@ -42,113 +51,194 @@ class TMSDataGenerator:
         "Story",
     ]
     SITES = ["Hyderabad", "London", "Sydney"]
+    OPERATING_SYSTEMS = ["Linux", "Windows", "macOS"]
+    # "HH:MM" strings indexed by minute of the day
+    CLOCK_TIMES = [f"{hour:02d}:{minute:02d}" for hour in range(24) for minute in range(60)]
 
-    def __init__(self):
-        """Initialize the TMSDataGenerator with Faker, logger, and DBClient."""
+    def __init__(self, seed: int = 42):
+        """Initialize the TMSDataGenerator with seeded random generators, logger, and the shared DBClient."""
         self.fake = Faker()
+        self.fake.seed_instance(seed)
+        self._rng = random.Random(seed)
         self.logger = get_logger(self.__class__.__name__)
-        self.db = DBClient()
+        self.db = get_db_client()
 
     def generate_users(self) -> list[dict]:
         """Generate a list of user dictionaries with realistic fake data."""
-        users = []
-        for user_index in range(1, 502):
-            user = {
-                "employee_id": f"E{user_index:03d}",
-                "full_name": self.fake.name(),
-                "email": self.fake.unique.email(),
-                "department": self.fake.random_element(self.DEPARTMENTS),
-                "site": self.fake.random_element(self.SITES),
+        rng = self._rng
+        name = self.fake.name
+        email = self.fake.unique.email
+        departments = rng.choices(self.DEPARTMENTS, k=self.USER_COUNT)
+        sites = rng.choices(self.SITES, k=self.USER_COUNT)
+        return [
+            {
+                "employee_id": employee_id,
+                "full_name": name(),
+                "email": email(),
+                "department": department,
+                "site": site,
                 "active": user_index % 2 == 0,
             }
-            users.append(user)
-        return users
+            for user_index, (employee_id, department, site) in enumerate(
+                zip(self.EMPLOYEE_IDS, departments, sites), start=1
+            )
+        ]
 
     def generate_timelogs(self, users: list[dict]) -> list[dict]:
-        """Generate a list of time log dictionaries for each user with realistic fake data."""
-        timelogs = []
+        """Generate a list of time log dictionaries for each user with realistic fake data.
+
+        All random values are drawn up front in one call per field rather than per row, and hostnames are
+        synthesized instead of going through Faker's provider chain.
+        """
+        count = len(users) * self.TIMELOGS_PER_USER
+        rng = self._rng
+        log_dates = [str(date(2025, 6, 1) + timedelta(days=log_index)) for log_index in range(self.TIMELOGS_PER_USER)]
+        draws = zip(
+            rng.choices(range(7, 11), k=count),  # login hour
+            rng.choices(range(7, 11), k=count),  # shift length in hours
+            rng.choices(range(60), k=count),  # login minute
+            rng.choices(range(60), k=count),  # logout minute
+            rng.choices(self.OPERATING_SYSTEMS, k=count),
+            rng.choices(range(10000), k=count),  # workstation number
+        )
+
+        clock_times = self.CLOCK_TIMES
+        timelogs: list[dict] = []
+        append = timelogs.append
         for user in users:
-            for log_index in range(self.TIMELOGS_PER_USER):
-                log_date = date(2025, 6, 1) + timedelta(days=log_index)
-                login_hour = self.fake.random_int(min=7, max=10)
-                logout_hour = login_hour + self.fake.random_int(min=7, max=10)
-                login_time = f"{login_hour:02d}:{self.fake.random_int(min=0, max=59):02d}"
-                logout_time = f"{logout_hour:02d}:{self.fake.random_int(min=0, max=59):02d}"
-                active_hours = round(
-                    (logout_hour + self.fake.random_int(min=0, max=59) / 60)
-                    - (login_hour + self.fake.random_int(min=0, max=59) / 60),
-                    1,
+            employee_id = user["employee_id"]
+            for log_date in log_dates:
+                login_hour, shift_hours, login_minute, logout_minute, os_name, workstation = next(draws)
+                logout_hour = login_hour + shift_hours
+                append(
+                    {
+                        "employee_id": employee_id,
+                        "date": log_date,  # Ensure date is a string for MongoDB
+                        "hostname": f"wks-{workstation:04d}",
+                        "os": os_name,
+                        "login_time": clock_times[login_hour * 60 + login_minute],
+                        "logout_time": clock_times[logout_hour * 60 + logout_minute],
+                        "active_hours": round(
+                            (logout_hour * 60 + logout_minute - login_hour * 60 - login_minute) / 60, 1
+                        ),
+                    }
                 )
-                timelog = {
-                    "employee_id": user["employee_id"],
-                    "date": str(log_date),  # Ensure date is a string for MongoDB
-                    "hostname": self.fake.hostname(),
-                    "os": self.fake.random_element(["Linux", "Windows", "macOS"]),
-                    "login_time": login_time,
-                    "logout_time": logout_time,
-                    "active_hours": active_hours,
-                }
-                timelogs.append(timelog)
         return timelogs
 
-    def seed_users(self, user_rows: list[dict]) -> None:
-        """Insert users into the database, ensuring uniqueness and validation."""
-        for user_row in user_rows:
-            try:
-                user = UserModel(**user_row)
-                if self.db.find_one("users", {"employee_id": user.employee_id}):
-                    self.logger.info(f"User with employee_id {user.employee_id} already exists. Skipping.")
-                    continue
-                self.db.insert_one("users", user.model_dump())
-                self.logger.info(f"Inserted user: {user.employee_id}")
-            except ValidationError as validation_exc:
-                self.logger.error(f"Validation failed for user {user_row}: {validation_exc}")
-            except PyMongoError as mongo_exc:
-                self.logger.error(f"MongoDB error inserting user {user_row}: {mongo_exc}")
-            except KeyError as key_exc:
-                self.logger.error(f"Missing field {key_exc} in user row: {user_row}")
+    def seed_users(self, user_rows: list[dict]) -> bool:
+        """Validate users and insert them in bulk; the unique employee_id index skips existing users.
+
+        Returns False if the users collection could not be prepared for seeding.
+        """
+        return self._insert_batches("users", self._validate_rows(USERS_ADAPTER, UserModel, user_rows, "user"))
+
+    def seed_timelogs(self, timelog_rows: list[dict]) -> bool:
+        """Validate time logs and insert them in bulk; the unique (employee_id, date) index skips existing logs.
 
-    def seed_timelogs(self, timelog_rows: list[dict]) -> None:
-        """Insert time logs into the database, ensuring validation."""
-        for timelog_row in timelog_rows:
+        Returns False if the time_logs collection could not be prepared for seeding.
+        """
+        return self._insert_batches(
+            "time_logs", self._validate_rows(TIMELOGS_ADAPTER, TimeLogModel, timelog_rows, "time log")
+        )
+
+    def _validate_rows(self, adapter: TypeAdapter, model: type[BaseModel], rows: list[dict], label: str) -> list[dict]:
+        """Validate and dump all rows in one pydantic-core call.
+
+        The dumped documents carry the schema's coerced and normalized values and are new dicts, so the ``_id``
+        that insert_many adds never lands in the caller's rows. If any row is invalid, the rows are validated one
+        by one instead so the valid ones are kept and each failure is logged.
+        """
+        try:
+            return adapter.dump_python(adapter.validate_python(rows), mode="json")
+        except ValidationError:
+            pass
+
+        documents = []
+        for row in rows:
             try:
-                # Convert string date to date for Pydantic model
-                if isinstance(timelog_row["date"], str):
-                    timelog_row["date"] = date.fromisoformat(timelog_row["date"])
-                timelog = TimeLogModel(
-                    employee_id=timelog_row["employee_id"],
-                    date=timelog_row["date"],
-                    hostname=timelog_row["hostname"],
-                    os=timelog_row["os"],
-                    login_time=timelog_row["login_time"],
-                    logout_time=timelog_row["logout_time"],
-                    active_hours=float(timelog_row["active_hours"]),
-                )
-                self.db.insert_one("time_logs", timelog.model_dump(mode="json"))
-                self.logger.info(f"Inserted time log for {timelog.employee_id} on {timelog.date}")
+                documents.append(model.model_validate(row).model_dump(mode="json"))
             except ValidationError as validation_exc:
-                self.logger.error(f"Validation failed for time log {timelog_row}: {validation_exc}")
+                self.logger.error("Validation failed for %s %s: %s", label, row, validation_exc)
+        return documents
+
+    def _insert_batches(self, collection_name: str, documents: list[dict]) -> bool:
+        """Insert documents with one unordered insert_many per batch of INSERT_BATCH_SIZE.
+
+        The collection's unique indexes from DBClient.INDEXES are created first; duplicate-key errors from them are
+        expected on re-runs and counted as skipped documents. Returns False without inserting anything if the
+        indexes cannot be built because the collection already holds duplicates.
+        """
+        index_models = DBClient.INDEXES.get(collection_name, [])
+        try:
+            self.db.ensure_indexes(collection_name, index_models)
+        except OperationFailure as index_exc:
+            if index_exc.code != self.DUPLICATE_KEY_ERROR:
+                raise
+            self.logger.error(
+                "Cannot create the unique indexes on %s because it already holds duplicate documents, "
+                "likely from seeding runs before the indexes existed. Remove the duplicates or drop the %s "
+                "collection, then run the seeder again.",
+                collection_name,
+                collection_name,
+            )
+            return False
+
+        key_fields = [field for model in index_models for field in model.document["key"]]
+        inserted = skipped = failed = 0
+        for start in range(0, len(documents), self.INSERT_BATCH_SIZE):
+            batch = documents[start : start + self.INSERT_BATCH_SIZE]
+            try:
+                self.db.insert_many(collection_name, batch, ordered=False)
+                inserted += len(batch)
+            except BulkWriteError as bulk_exc:
+                inserted += bulk_exc.details["nInserted"]
+                for write_error in bulk_exc.details["writeErrors"]:
+                    if write_error["code"] == self.DUPLICATE_KEY_ERROR:
+                        skipped += 1
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug(
+                                "Document with %s already exists in %s. Skipping.",
+                                ", ".join(f"{field}={write_error['op'][field]}" for field in key_fields),
+                                collection_name,
+                            )
+                    else:
+                        failed += 1
+                        self.logger.error("MongoDB error inserting into %s: %s", collection_name, write_error["errmsg"])
             except PyMongoError as mongo_exc:
-                self.logger.error(f"MongoDB error inserting time log {timelog_row}: {mongo_exc}")
-            except KeyError as key_exc:
-                self.logger.error(f"Missing field {key_exc} in time log row: {timelog_row}")
-            except ValueError as value_exc:
-                self.logger.error(f"Value error in time log row {timelog_row}: {value_exc}")
-
-    def run(self) -> None:
-        """Generate fake data and seed the MongoDB database with users and time logs."""
-        users = self.generate_users()
-        timelogs = self.generate_timelogs(users)
-        self.seed_users(users)
-        self.seed_timelogs(timelogs)
-        self.db.close_connection()
-        self.logger.info("Database seeding complete.")
+                failed += len(batch)
+                self.logger.error("MongoDB error inserting into %s: %s", collection_name, mongo_exc)
+        self.logger.info(
+            "Inserted %d documents into %s, %d skipped as duplicates, %d failed",
+            inserted,
+            collection_name,
+            skipped,
+            failed,
+        )
+        return True
+
+    def run(self) -> bool:
+        """Generate fake data and seed the MongoDB database with users and time logs.
+
+        Returns False if seeding stopped early because a collection could not be prepared.
+        """
+        try:
+            users = self.generate_users()
+            timelogs = self.generate_timelogs(users)
+            seeded = self.seed_users(users) and self.seed_timelogs(timelogs)
+        finally:
+            self.db.close_connection()
+        if seeded:
+            self.logger.info("Database seeding complete.")
+        else:
+            self.logger.error("Database seeding stopped early.")
+        return seeded
 
 
 def main() -> None:
     """Entry point for running the TMSDataGenerator as a script."""
     seeder = TMSDataGenerator()
-    seeder.run()
+    if not seeder.run():
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":